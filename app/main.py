@@ -1,5 +1,6 @@
 """Main FastAPI application for Contaspiccioli."""
 import logging
+from collections import defaultdict
 from contextlib import asynccontextmanager
 from datetime import date, datetime
 from typing import Optional
@@ -8,14 +9,14 @@ from fastapi import FastAPI, Request, Depends, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.config import settings
 from app.database import init_db, get_db, SessionLocal
 from app.models import Category, Transaction, Pillar, TaxDeadline, UserProfile, MonthlyIncome
 from app.routers import api
 from app.services import budget
-from app.utils import format_currency, format_percentage, format_date, month_name
+from app.utils import format_currency, format_percentage, format_date, month_name, MONTH_NAMES
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,8 +24,8 @@ logger = logging.getLogger(__name__)
 
 def seed_default_data(db: Session):
     """Seed default categories, pillars, and tax deadlines."""
-    # Check if already seeded
-    if db.query(Category).count() > 0:
+    # Check if already seeded (EXISTS stops at the first row, unlike COUNT)
+    if db.query(db.query(Category).exists()).scalar():
         return
 
     logger.info("Seeding default data...")
@@ -55,14 +56,15 @@ def seed_default_data(db: Session):
         "Salute": "", "Contanti": ""
     }
 
-    for name, budget_amount, cat_type in fixed_categories + variable_categories:
-        cat = Category(
+    db.add_all([
+        Category(
             name=name,
             type=cat_type,
             monthly_budget=budget_amount,
             icon=icons.get(name, "")
         )
-        db.add(cat)
+        for name, budget_amount, cat_type in fixed_categories + variable_categories
+    ])
 
     # Income category
     db.add(Category(name="Stipendio/Fatture", type="entrata", monthly_budget=0, icon=""))
@@ -74,8 +76,8 @@ def seed_default_data(db: Session):
         ("investimenti", "ETF Investimenti (4)", 0, settings.default_income * settings.investment_percentage, settings.investment_percentage),
     ]
 
-    for name, display, target, contrib, pct in pillars:
-        pillar = Pillar(
+    db.add_all([
+        Pillar(
             name=name,
             display_name=display,
             target_balance=target,
@@ -83,7 +85,8 @@ def seed_default_data(db: Session):
             monthly_contribution=contrib,
             percentage=pct
         )
-        db.add(pillar)
+        for name, display, target, contrib, pct in pillars
+    ])
 
     # Tax deadlines 2026
     deadlines = [
@@ -91,9 +94,10 @@ def seed_default_data(db: Session):
         ("2 acconto 2025", date(2026, 11, 30), 5460),
     ]
 
-    for name, due, amount in deadlines:
-        deadline = TaxDeadline(name=name, due_date=due, amount=amount)
-        db.add(deadline)
+    db.add_all([
+        TaxDeadline(name=name, due_date=due, amount=amount)
+        for name, due, amount in deadlines
+    ])
 
     db.commit()
     logger.info("Default data seeded successfully")
@@ -148,7 +152,6 @@ def get_or_create_profile(db: Session) -> UserProfile:
         profile = UserProfile()
         db.add(profile)
         db.commit()
-        db.refresh(profile)
     return profile
 
 
@@ -251,7 +254,7 @@ async def setup_submit(
         profile.setup_completed = True
 
         # Update pillars with profile data
-        _update_pillars_from_profile(db, profile)
+        _update_pillars_from_profile(db, profile, commit=False)
 
     db.commit()
 
@@ -261,8 +264,12 @@ async def setup_submit(
         return RedirectResponse(url="/summary", status_code=303)
 
 
-def _update_pillars_from_profile(db: Session, profile: UserProfile):
-    """Update pillar settings based on user profile."""
+def _update_pillars_from_profile(db: Session, profile: UserProfile, commit: bool = True):
+    """Update pillar settings based on user profile.
+
+    Pass commit=False when the caller commits the profile changes itself,
+    so both are written in a single transaction.
+    """
     # Single query for all pillars
     pillars = db.query(Pillar).filter(
         Pillar.name.in_(["emergenza", "tasse", "investimenti"])
@@ -286,7 +293,8 @@ def _update_pillars_from_profile(db: Session, profile: UserProfile):
         pillar_map["investimenti"].monthly_contribution = profile.monthly_income * profile.investment_percentage
         pillar_map["investimenti"].actual_balance = profile.investment_balance
 
-    db.commit()
+    if commit:
+        db.commit()
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -411,6 +419,11 @@ async def annual_summary(request: Request, year: Optional[int] = None, db: Sessi
         TaxDeadline.due_date <= date(year, 12, 31)
     ).order_by(TaxDeadline.due_date).all()
 
+    # Amount due per month, so the calendar loop doesn't rescan every deadline
+    payments_by_month = defaultdict(float)
+    for d in deadlines:
+        payments_by_month[d.due_date.month] += d.residuo
+
     # Build calendar data
     calendar = []
     tax_balance = profile.tax_balance
@@ -426,10 +439,7 @@ async def annual_summary(request: Request, year: Optional[int] = None, db: Sessi
         variable = profile.total_variable_budget
 
         # Check for tax payments this month
-        tax_payment = 0
-        for d in deadlines:
-            if d.due_date.month == month and d.due_date.year == year:
-                tax_payment += d.residuo
+        tax_payment = payments_by_month.get(month, 0)
 
         # Available after allocations
         available = month_income - fixed - tax_allocation - investment_allocation
@@ -449,7 +459,7 @@ async def annual_summary(request: Request, year: Optional[int] = None, db: Sessi
 
         calendar.append({
             'month': month,
-            'name': month_name(month),
+            'name': MONTH_NAMES[month],
             'income': month_income,
             'has_extra': False,
             'tax_allocation': tax_allocation,
@@ -490,7 +500,10 @@ async def transactions_page(
     if not month:
         month = today.month
 
-    transactions = db.query(Transaction).filter(
+    # The template shows each transaction's category: load them in the same query
+    transactions = db.query(Transaction).options(
+        joinedload(Transaction.category)
+    ).filter(
         Transaction.date >= date(year, month, 1)
     ).order_by(Transaction.date.desc()).all()
 
@@ -542,7 +555,8 @@ async def pillars_page(request: Request, db: Session = Depends(get_db)):
 
     return templates.TemplateResponse("pillars.html", {
         "request": request,
-        "pillars": pillars
+        "pillars": pillars,
+        "totals": budget.get_pillar_totals(pillars)
     })
 
 
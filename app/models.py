@@ -1,5 +1,5 @@
 """SQLAlchemy models for Contaspiccioli."""
-from datetime import datetime, date
+from datetime import datetime
 from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Date, ForeignKey, Text
 from sqlalchemy.orm import relationship
 
@@ -58,7 +58,7 @@ class TaxDeadline(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
-    due_date = Column(Date, nullable=False)
+    due_date = Column(Date, nullable=False, index=True)
     amount = Column(Float, nullable=False)
     paid = Column(Float, default=0.0)
     notified_7d = Column(Boolean, default=False)
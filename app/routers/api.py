@@ -100,7 +100,7 @@ def create_category(data: CategoryCreate, db: Session = Depends(get_db)):
 @router.put("/categories/{category_id}", response_model=CategoryResponse)
 def update_category(category_id: int, data: CategoryCreate, db: Session = Depends(get_db)):
     """Update an existing category."""
-    category = db.query(Category).filter(Category.id == category_id).first()
+    category = db.get(Category, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
 
@@ -115,7 +115,7 @@ def update_category(category_id: int, data: CategoryCreate, db: Session = Depend
 @router.delete("/categories/{category_id}")
 def delete_category(category_id: int, db: Session = Depends(get_db)):
     """Soft delete a category."""
-    category = db.query(Category).filter(Category.id == category_id).first()
+    category = db.get(Category, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
 
@@ -160,7 +160,7 @@ def create_transaction(data: TransactionCreate, db: Session = Depends(get_db)):
 @router.put("/transactions/{transaction_id}", response_model=TransactionResponse)
 def update_transaction(transaction_id: int, data: TransactionCreate, db: Session = Depends(get_db)):
     """Update an existing transaction."""
-    transaction = db.query(Transaction).filter(Transaction.id == transaction_id).first()
+    transaction = db.get(Transaction, transaction_id)
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
 
@@ -175,7 +175,7 @@ def update_transaction(transaction_id: int, data: TransactionCreate, db: Session
 @router.delete("/transactions/{transaction_id}")
 def delete_transaction(transaction_id: int, db: Session = Depends(get_db)):
     """Delete a transaction."""
-    transaction = db.query(Transaction).filter(Transaction.id == transaction_id).first()
+    transaction = db.get(Transaction, transaction_id)
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
 
@@ -195,7 +195,7 @@ def list_pillars(db: Session = Depends(get_db)):
 @router.put("/pillars/{pillar_id}/reconcile", response_model=PillarResponse)
 def reconcile_pillar(pillar_id: int, data: PillarReconcile, db: Session = Depends(get_db)):
     """Update actual balance for a pillar (reconciliation)."""
-    pillar = db.query(Pillar).filter(Pillar.id == pillar_id).first()
+    pillar = db.get(Pillar, pillar_id)
     if not pillar:
         raise HTTPException(status_code=404, detail="Pillar not found")
 
@@ -267,7 +267,7 @@ def list_deadlines(db: Session = Depends(get_db)):
 @router.put("/deadlines/{deadline_id}/pay")
 def pay_deadline(deadline_id: int, data: DeadlinePayment, db: Session = Depends(get_db)):
     """Record a payment for a tax deadline."""
-    deadline = db.query(TaxDeadline).filter(TaxDeadline.id == deadline_id).first()
+    deadline = db.get(TaxDeadline, deadline_id)
     if not deadline:
         raise HTTPException(status_code=404, detail="Deadline not found")
 
@@ -3,7 +3,9 @@ import csv
 import io
 import re
 from datetime import datetime
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List
 from collections import defaultdict
 
 
@@ -20,6 +22,26 @@ CATEGORY_KEYWORDS = {
     "Contanti": ["prelievo", "atm", "bancomat", "cash"],
 }
 
+# One compiled alternation per category, checked in CATEGORY_KEYWORDS order
+# so the first matching category still wins
+_CATEGORY_PATTERNS = tuple(
+    (category, re.compile("|".join(map(re.escape, keywords))))
+    for category, keywords in CATEGORY_KEYWORDS.items()
+)
+
+# Delimiters tried in order when reading a CSV
+_DELIMITERS = (";", ",", "\t")
+
+# Common column name variations
+_DATE_COLUMNS = ("data", "date", "data operazione", "data contabile", "data valuta")
+_DESCRIPTION_COLUMNS = ("descrizione", "description", "causale", "movimento", "dettaglio")
+_AMOUNT_COLUMNS = ("importo", "amount", "dare", "avere", "entrate", "uscite", "movimento")
+
+_DATE_FORMATS = (
+    "%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d", "%d.%m.%Y",
+    "%d/%m/%y", "%d-%m-%y", "%Y/%m/%d"
+)
+
 
 def parse_bank_statement(content: str, file_type: str = "csv") -> List[Dict]:
     """
@@ -40,15 +62,20 @@ def _parse_csv(content: str) -> List[Dict]:
     transactions = []
 
     # Try different delimiters
-    for delimiter in [";", ",", "\t"]:
+    for delimiter in _DELIMITERS:
         try:
             reader = csv.DictReader(io.StringIO(content), delimiter=delimiter)
-            rows = list(reader)
-            if rows and len(rows[0]) > 2:
-                for row in rows:
+            # Peek at the first row to validate the delimiter, then stream the rest
+            first_row = next(reader, None)
+            if first_row and len(first_row) > 2:
+                # Only keep rows once the whole file parsed without errors,
+                # so a failure midway still falls back to the next strategy
+                parsed = []
+                for row in chain((first_row,), reader):
                     trans = _parse_row(row)
                     if trans:
-                        transactions.append(trans)
+                        parsed.append(trans)
+                transactions = parsed
                 break
         except:
             continue
@@ -66,7 +93,7 @@ def _parse_csv_positional(content: str) -> List[Dict]:
     lines = content.strip().split("\n")
 
     for line in lines[1:]:  # Skip header
-        for delimiter in [";", ",", "\t"]:
+        for delimiter in _DELIMITERS:
             parts = line.split(delimiter)
             if len(parts) >= 3:
                 trans = _extract_transaction(parts)
@@ -79,28 +106,23 @@ def _parse_csv_positional(content: str) -> List[Dict]:
 
 def _parse_row(row: Dict) -> Dict:
     """Parse a single row from CSV."""
-    # Common column name variations
-    date_cols = ["data", "date", "data operazione", "data contabile", "data valuta"]
-    desc_cols = ["descrizione", "description", "causale", "movimento", "dettaglio"]
-    amount_cols = ["importo", "amount", "dare", "avere", "entrate", "uscite", "movimento"]
-
     date_val = None
     desc_val = None
     amount_val = None
 
     row_lower = {k.lower().strip(): v for k, v in row.items()}
 
-    for col in date_cols:
+    for col in _DATE_COLUMNS:
         if col in row_lower and row_lower[col]:
             date_val = _parse_date(row_lower[col])
             break
 
-    for col in desc_cols:
+    for col in _DESCRIPTION_COLUMNS:
         if col in row_lower and row_lower[col]:
             desc_val = row_lower[col].strip()
             break
 
-    for col in amount_cols:
+    for col in _AMOUNT_COLUMNS:
         if col in row_lower and row_lower[col]:
             amount_val = _parse_amount(row_lower[col])
             if amount_val != 0:
@@ -152,15 +174,12 @@ def _extract_transaction(parts: List[str]) -> Dict:
     return None
 
 
+@lru_cache(maxsize=4096)
 def _parse_date(val: str) -> datetime:
     """Parse date from various formats."""
     val = val.strip()
-    formats = [
-        "%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d", "%d.%m.%Y",
-        "%d/%m/%y", "%d-%m-%y", "%Y/%m/%d"
-    ]
 
-    for fmt in formats:
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(val, fmt).date()
         except:
@@ -169,6 +188,7 @@ def _parse_date(val: str) -> datetime:
     return None
 
 
+@lru_cache(maxsize=4096)
 def _parse_amount(val: str) -> float:
     """Parse amount from various formats."""
     val = val.strip().strip('"')
@@ -204,10 +224,9 @@ def _categorize(description: str) -> str:
     """Auto-categorize transaction based on description."""
     desc_lower = description.lower()
 
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in desc_lower:
-                return category
+    for category, pattern in _CATEGORY_PATTERNS:
+        if pattern.search(desc_lower):
+            return category
 
     return "Altro"
 
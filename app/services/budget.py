@@ -1,8 +1,8 @@
 """Budget calculation service."""
 from datetime import date
-from typing import Any, Dict, List
+from typing import Dict, List
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy import extract
 
 from app.models import Transaction, Category, Pillar, MonthlyForecast
 from app.config import settings
@@ -10,28 +10,39 @@ from app.config import settings
 
 def get_monthly_summary(db: Session, year: int, month: int) -> Dict:
     """Get budget summary for a specific month."""
-    # Get all transactions for the month
-    transactions = db.query(Transaction).filter(
+    # Stream only the columns needed for aggregation instead of hydrating
+    # every Transaction (and its Category) into memory
+    rows = db.query(
+        Transaction.amount,
+        Transaction.is_income,
+        Category.name,
+        Category.monthly_budget,
+        Category.icon,
+        Category.type,
+    ).outerjoin(Category, Transaction.category_id == Category.id).filter(
         extract('year', Transaction.date) == year,
         extract('month', Transaction.date) == month
-    ).all()
+    ).yield_per(1000)
 
-    income = sum(t.amount for t in transactions if t.is_income)
-    expenses = sum(t.amount for t in transactions if not t.is_income)
+    income = 0
+    expenses = 0
 
     # Get expenses by category
     category_spending = {}
-    for t in transactions:
-        if not t.is_income and t.category:
-            cat_name = t.category.name
+    for amount, is_income, cat_name, cat_budget, cat_icon, cat_type in rows:
+        if is_income:
+            income += amount
+            continue
+        expenses += amount
+        if cat_name is not None:
             if cat_name not in category_spending:
                 category_spending[cat_name] = {
-                    'budget': t.category.monthly_budget,
+                    'budget': cat_budget,
                     'spent': 0,
-                    'icon': t.category.icon,
-                    'type': t.category.type
+                    'icon': cat_icon,
+                    'type': cat_type
                 }
-            category_spending[cat_name]['spent'] += t.amount
+            category_spending[cat_name]['spent'] += amount
 
     # Calculate percentages and alerts
     for cat_name, data in category_spending.items():
@@ -70,10 +81,11 @@ def get_monthly_summary(db: Session, year: int, month: int) -> Dict:
 def get_pillar_summary(db: Session) -> List[Dict]:
     """Get summary of all financial pillars."""
     pillars = db.query(Pillar).all()
+    months = _months_elapsed()
     result = []
 
     for p in pillars:
-        theoretical = p.target_balance + (p.monthly_contribution * _months_elapsed())
+        theoretical = p.target_balance + (p.monthly_contribution * months)
         result.append({
             'id': p.id,
             'name': p.name,
@@ -90,6 +102,20 @@ def get_pillar_summary(db: Session) -> List[Dict]:
     return result
 
 
+def get_pillar_totals(pillars: List[Dict]) -> Dict:
+    """Sum theoretical and actual balances of a pillar summary in one pass."""
+    theoretical = 0.0
+    actual = 0.0
+    for p in pillars:
+        theoretical += p['theoretical']
+        actual += p['actual']
+
+    return {
+        'theoretical': theoretical,
+        'actual': actual,
+    }
+
+
 def _months_elapsed() -> int:
     """Calculate months elapsed in current year."""
     today = date.today()
@@ -98,23 +124,29 @@ def _months_elapsed() -> int:
 
 def get_yearly_forecast(db: Session, year: int) -> List[Dict]:
     """Get forecast for all months of a year."""
-    forecasts = db.query(MonthlyForecast).filter(
-        MonthlyForecast.year == year
-    ).order_by(MonthlyForecast.month).all()
+    forecasts = {
+        f.month: f for f in db.query(MonthlyForecast).filter(
+            MonthlyForecast.year == year
+        )
+    }
+
+    # Defaults for months without a forecast only depend on settings
+    default_expenses = settings.default_income * (settings.fixed_percentage + settings.variable_percentage)
+    default_balance = settings.default_income * (1 - settings.tax_percentage - settings.investment_percentage) - \
+                      settings.default_income * settings.fixed_percentage - \
+                      settings.default_income * settings.variable_percentage
 
     result = []
     cumulative = 0
 
     for month in range(1, 13):
-        forecast = next((f for f in forecasts if f.month == month), None)
+        forecast = forecasts.get(month)
 
         if forecast:
             expected = forecast.expected_income - forecast.expected_fixed - forecast.expected_variable
             actual = forecast.actual_income - forecast.actual_fixed - forecast.actual_variable
         else:
-            expected = settings.default_income * (1 - settings.tax_percentage - settings.investment_percentage) - \
-                       settings.default_income * settings.fixed_percentage - \
-                       settings.default_income * settings.variable_percentage
+            expected = default_balance
             actual = 0
 
         cumulative += actual if forecast else expected
@@ -122,8 +154,7 @@ def get_yearly_forecast(db: Session, year: int) -> List[Dict]:
         result.append({
             'month': month,
             'expected_income': forecast.expected_income if forecast else settings.default_income,
-            'expected_expenses': (forecast.expected_fixed + forecast.expected_variable) if forecast else \
-                                 settings.default_income * (settings.fixed_percentage + settings.variable_percentage),
+            'expected_expenses': (forecast.expected_fixed + forecast.expected_variable) if forecast else default_expenses,
             'actual_income': forecast.actual_income if forecast else 0,
             'actual_expenses': (forecast.actual_fixed + forecast.actual_variable) if forecast else 0,
             'balance': actual if forecast else expected,
@@ -1,9 +1,12 @@
 """Forecast and projection service."""
+from collections import defaultdict
 from datetime import date
 from typing import Dict, List
 from sqlalchemy.orm import Session
+from sqlalchemy import func
 
 from app.models import UserProfile, MonthlyIncome, Pillar, TaxDeadline
+from app.utils import MONTH_NAMES
 
 
 def get_monthly_projection(db: Session, profile: UserProfile, months_ahead: int = 12) -> List[Dict]:
@@ -27,10 +30,14 @@ def get_monthly_projection(db: Session, profile: UserProfile, months_ahead: int
     # Use actual income if available, otherwise use profile default
     base_income = sum(i.amount for i in current_incomes) if current_incomes else profile.monthly_income
 
-    # Get current pillar balances
-    emergency_pillar = db.query(Pillar).filter(Pillar.name == "emergenza").first()
-    tax_pillar = db.query(Pillar).filter(Pillar.name == "tasse").first()
-    invest_pillar = db.query(Pillar).filter(Pillar.name == "investimenti").first()
+    # Get current pillar balances (single query for all pillars)
+    pillars = db.query(Pillar).filter(
+        Pillar.name.in_(["emergenza", "tasse", "investimenti"])
+    ).all()
+    pillar_map = {p.name: p for p in pillars}
+    emergency_pillar = pillar_map.get("emergenza")
+    tax_pillar = pillar_map.get("tasse")
+    invest_pillar = pillar_map.get("investimenti")
 
     # Starting balances
     current_balance = profile.current_balance
@@ -43,6 +50,11 @@ def get_monthly_projection(db: Session, profile: UserProfile, months_ahead: int
         TaxDeadline.due_date >= today
     ).order_by(TaxDeadline.due_date).all()
 
+    # Amount due per (year, month), so the loop doesn't rescan every deadline
+    payments_by_month = defaultdict(float)
+    for deadline in deadlines:
+        payments_by_month[(deadline.due_date.year, deadline.due_date.month)] += deadline.residuo
+
     for i in range(months_ahead):
         month = (today.month + i - 1) % 12 + 1
         year = today.year + (today.month + i - 1) // 12
@@ -71,16 +83,13 @@ def get_monthly_projection(db: Session, profile: UserProfile, months_ahead: int
                 current_balance -= emergency_contribution
 
         # Check for tax payments in this month
-        tax_payment = 0
-        for deadline in deadlines:
-            if deadline.due_date.year == year and deadline.due_date.month == month:
-                tax_payment += deadline.residuo
-                tax_balance -= deadline.residuo
+        tax_payment = payments_by_month.get((year, month), 0)
+        tax_balance -= tax_payment
 
         projections.append({
             'month': month,
             'year': year,
-            'month_name': _month_name(month),
+            'month_name': MONTH_NAMES[month],
             'income': base_income,
             'allocations': {
                 'fixed': fixed_expenses,
@@ -141,24 +150,32 @@ def get_tax_coverage(db: Session, profile: UserProfile) -> Dict:
     - How much is owed
     - Coverage percentage
     """
-    tax_pillar = db.query(Pillar).filter(Pillar.name == "tasse").first()
-
-    # Get upcoming deadlines
+    # Tax pillar balance and amount still owed on upcoming deadlines,
+    # fetched together in one round-trip (Pillar.name is unique/indexed)
     today = date.today()
-    deadlines = db.query(TaxDeadline).filter(
+    tax_balance, total_owed = db.query(
+        db.query(Pillar.actual_balance).filter(
+            Pillar.name == "tasse"
+        ).scalar_subquery(),
+        db.query(
+            func.coalesce(func.sum(TaxDeadline.amount - TaxDeadline.paid), 0)
+        ).filter(TaxDeadline.due_date >= today).scalar_subquery(),
+    ).one()
+
+    next_deadline = db.query(TaxDeadline).filter(
         TaxDeadline.due_date >= today
-    ).order_by(TaxDeadline.due_date).all()
+    ).order_by(TaxDeadline.due_date).first()
 
-    total_owed = sum(d.residuo for d in deadlines)
-    accrued = tax_pillar.actual_balance if tax_pillar else profile.tax_balance
+    accrued = tax_balance if tax_balance is not None else profile.tax_balance
+    difference = accrued - total_owed
 
     return {
         'accrued': accrued,
         'total_owed': total_owed,
         'coverage_percentage': (accrued / total_owed * 100) if total_owed > 0 else 100,
-        'shortfall': max(0, total_owed - accrued),
-        'surplus': max(0, accrued - total_owed),
-        'next_deadline': deadlines[0] if deadlines else None,
+        'shortfall': max(0, -difference),
+        'surplus': max(0, difference),
+        'next_deadline': next_deadline,
     }
 
 
@@ -200,11 +217,3 @@ def get_yearly_summary(db: Session, profile: UserProfile, year: int) -> Dict:
         'net_monthly': (total_projected - taxes['total_tax']) / 12,
     }
 
-
-def _month_name(month: int) -> str:
-    """Get Italian month name."""
-    months = [
-        "", "Gennaio", "Febbraio", "Marzo", "Aprile", "Maggio", "Giugno",
-        "Luglio", "Agosto", "Settembre", "Ottobre", "Novembre", "Dicembre"
-    ]
-    return months[month] if 1 <= month <= 12 else ""
@@ -1,5 +1,7 @@
 """Telegram notification service."""
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 from html import escape as escape_html
 
@@ -9,15 +11,65 @@ logger = logging.getLogger(__name__)
 
 TELEGRAM_BOT_TOKEN = settings.telegram_bot_token
 TELEGRAM_CHAT_ID = settings.telegram_chat_id
+TELEGRAM_API_URL = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+TELEGRAM_CONFIGURED = bool(TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID)
+
+# Shared session so consecutive notifications reuse the HTTPS connection
+_session = requests.Session()
+
+# Single worker: notifications are delivered in order, and every send
+# (including synchronous ones) runs here so the session stays on one thread
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="telegram")
+
+# Message templates (HTML parse mode), formatted with str.format
+TEMPLATE_TAX_DEADLINE = (
+    "{emoji} <b>Scadenza Fiscale Imminente</b>\n\n"
+    "<b>Scadenza:</b> {name}\n"
+    "<b>Data:</b> {due_date}\n"
+    "<b>Importo:</b> {amount:,.2f}\n"
+    "<b>Giorni rimanenti:</b> {days_remaining}"
+)
+TEMPLATE_BUDGET_EXCEEDED = (
+    " <b>Budget Superato</b>\n\n"
+    "<b>Categoria:</b> {category}\n"
+    "<b>Budget:</b> {budget:,.2f}\n"
+    "<b>Speso:</b> {spent:,.2f}\n"
+    "<b>Percentuale:</b> {percentage:.1f}%"
+)
+TEMPLATE_MONTHLY_SUMMARY = (
+    "{emoji} <b>Riepilogo Mensile - {month}</b>\n\n"
+    "<b>Entrate:</b> {income:,.2f}\n"
+    "<b>Uscite:</b> {expenses:,.2f}\n"
+    "<b>Saldo:</b> {balance:,.2f}"
+)
 
 
 def is_telegram_configured() -> bool:
     """Check if Telegram is properly configured."""
-    return bool(TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID)
+    return TELEGRAM_CONFIGURED
+
+
+def _post_message(message: str, parse_mode: str) -> bool:
+    """Post a message to the Telegram API. Runs on the executor thread."""
+    payload = {
+        'chat_id': TELEGRAM_CHAT_ID,
+        'text': message,
+        'parse_mode': parse_mode,
+        'disable_web_page_preview': True
+    }
+
+    try:
+        response = _session.post(TELEGRAM_API_URL, json=payload, timeout=10)
+        response.raise_for_status()
+        logger.info("Telegram message sent successfully")
+        return True
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Failed to send Telegram message: {e}")
+        return False
 
 
 def send_telegram_message(message: str, parse_mode: str = 'HTML') -> bool:
-    """Send a message via Telegram bot.
+    """Send a message via Telegram bot and wait for the result.
 
     Args:
         message: The message text to send
@@ -30,56 +82,66 @@ def send_telegram_message(message: str, parse_mode: str = 'HTML') -> bool:
         logger.debug("Telegram not configured, skipping notification")
         return False
 
-    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-    payload = {
-        'chat_id': TELEGRAM_CHAT_ID,
-        'text': message,
-        'parse_mode': parse_mode,
-        'disable_web_page_preview': True
-    }
+    return _executor.submit(_post_message, message, parse_mode).result()
 
-    try:
-        response = requests.post(url, json=payload, timeout=10)
-        response.raise_for_status()
-        logger.info("Telegram message sent successfully")
-        return True
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to send Telegram message: {e}")
+
+def queue_telegram_message(message: str, parse_mode: str = 'HTML') -> bool:
+    """Send a message via Telegram bot without blocking the caller.
+
+    Delivery happens on a background thread; failures are logged there.
+
+    Returns:
+        True if the message was queued, False if Telegram is not configured
+    """
+    if not is_telegram_configured():
+        logger.debug("Telegram not configured, skipping notification")
         return False
 
+    _executor.submit(_post_message, message, parse_mode)
+    return True
+
 
 def notify_tax_deadline_reminder(deadline_name: str, due_date: str, amount: float, days_remaining: int) -> bool:
-    """Notify about an upcoming tax deadline."""
+    """Notify about an upcoming tax deadline.
+
+    Returns True once the message is queued, not when it is delivered.
+    """
     emoji = "" if days_remaining <= 1 else ""
-    message = (
-        f"{emoji} <b>Scadenza Fiscale Imminente</b>\n\n"
-        f"<b>Scadenza:</b> {escape_html(deadline_name)}\n"
-        f"<b>Data:</b> {escape_html(due_date)}\n"
-        f"<b>Importo:</b> {amount:,.2f}\n"
-        f"<b>Giorni rimanenti:</b> {days_remaining}"
+    message = TEMPLATE_TAX_DEADLINE.format(
+        emoji=emoji,
+        name=escape_html(deadline_name),
+        due_date=escape_html(due_date),
+        amount=amount,
+        days_remaining=days_remaining,
     )
-    return send_telegram_message(message)
+    return queue_telegram_message(message)
 
 
 def notify_budget_exceeded(category_name: str, budget: float, spent: float, percentage: float) -> bool:
-    """Notify when a budget category is exceeded."""
-    message = (
-        f" <b>Budget Superato</b>\n\n"
-        f"<b>Categoria:</b> {escape_html(category_name)}\n"
-        f"<b>Budget:</b> {budget:,.2f}\n"
-        f"<b>Speso:</b> {spent:,.2f}\n"
-        f"<b>Percentuale:</b> {percentage:.1f}%"
+    """Notify when a budget category is exceeded.
+
+    Returns True once the message is queued, not when it is delivered.
+    """
+    message = TEMPLATE_BUDGET_EXCEEDED.format(
+        category=escape_html(category_name),
+        budget=budget,
+        spent=spent,
+        percentage=percentage,
     )
-    return send_telegram_message(message)
+    return queue_telegram_message(message)
 
 
 def notify_monthly_summary(month: str, income: float, expenses: float, balance: float) -> bool:
-    """Send monthly summary notification."""
+    """Send monthly summary notification.
+
+    Returns True once the message is queued, not when it is delivered.
+    """
     emoji = "" if balance >= 0 else ""
-    message = (
-        f"{emoji} <b>Riepilogo Mensile - {escape_html(month)}</b>\n\n"
-        f"<b>Entrate:</b> {income:,.2f}\n"
-        f"<b>Uscite:</b> {expenses:,.2f}\n"
-        f"<b>Saldo:</b> {balance:,.2f}"
+    message = TEMPLATE_MONTHLY_SUMMARY.format(
+        emoji=emoji,
+        month=escape_html(month),
+        income=income,
+        expenses=expenses,
+        balance=balance,
     )
-    return send_telegram_message(message)
+    return queue_telegram_message(message)
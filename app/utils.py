@@ -3,20 +3,27 @@ from typing import Optional, Union
 from datetime import date
 
 
+# Index 0 is a "" sentinel so MONTH_NAMES[month] works for 1-12
+MONTH_NAMES = (
+    "", "Gennaio", "Febbraio", "Marzo", "Aprile", "Maggio", "Giugno",
+    "Luglio", "Agosto", "Settembre", "Ottobre", "Novembre", "Dicembre"
+)
+
+
 def month_name(month: int) -> str:
     """Get Italian month name."""
-    months = [
-        "", "Gennaio", "Febbraio", "Marzo", "Aprile", "Maggio", "Giugno",
-        "Luglio", "Agosto", "Settembre", "Ottobre", "Novembre", "Dicembre"
-    ]
-    return months[month] if 1 <= month <= 12 else ""
+    return MONTH_NAMES[month] if 1 <= month <= 12 else ""
+
+
+# Swap US separators for Italian ones in a single pass
+_CURRENCY_TABLE = str.maketrans({",": ".", ".": ","})
 
 
 def format_currency(value: Optional[float]) -> str:
     """Format number as Euro currency."""
     if value is None:
         return "0,00"
-    return f"{value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+    return f"{value:,.2f}".translate(_CURRENCY_TABLE)
 
 
 def format_percentage(value: Optional[float]) -> str:
@@ -32,4 +39,4 @@ def format_date(value: Optional[Union[date, str]]) -> str:
         return ""
     if isinstance(value, str):
         return value
-    return value.strftime("%d/%m/%Y")
+    return f"{value.day:02d}/{value.month:02d}/{value.year:04d}"